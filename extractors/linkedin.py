@@ -16,5 +16,6 @@ def extract_linkedin(pdf_path: str, output_path: str):
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
 
+# Many PDFs at once (parallel, cached, page-level JSONL): extractors/pdf_batch.py --source linkedin <dir>
 if __name__ == "__main__":
     extract_linkedin("data/linkedin.pdf", "processed/linkedin.json")
\ No newline at end of file
@@ -0,0 +1,271 @@
+import argparse
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from PyPDF2 import PdfReader
+
+
+CACHE_DIR = Path("processed") / ".pdf_cache"
+PAGES_PER_TASK = 8  # pages handed to a worker per task; amortizes re-opening the PDF
+PAGE_SEP = " "      # same joiner as the single-file resume/linkedin extractors
+MAX_POOL_ATTEMPTS = 2  # a file in flight for this many worker crashes is skipped
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Worker: extract text for pages [start, stop) of one PDF."""
+    reader = PdfReader(pdf_path)
+    return [(reader.pages[i].extract_text() or "") for i in range(start, stop)]
+
+
+# ------------------------------
+# Per-page cache, keyed by content hash
+# ------------------------------
+def _page_cache_path(cache_dir: Path, sha: str, page: int) -> Path:
+    return cache_dir / sha / f"page_{page:05d}.txt"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_cached_pages(cache_dir: Path, sha: str) -> Optional[List[str]]:
+    """Return all page texts if the file was fully extracted before, else None."""
+    meta_path = cache_dir / sha / "meta.json"
+    if not meta_path.exists():
+        return None
+    num_pages = json.loads(meta_path.read_text(encoding="utf-8"))["num_pages"]
+    pages = []
+    for i in range(num_pages):
+        p = _page_cache_path(cache_dir, sha, i)
+        if not p.exists():
+            return None
+        pages.append(p.read_text(encoding="utf-8"))
+    return pages
+
+
+def _cached_page(cache_dir: Path, sha: str, page: int) -> Optional[str]:
+    p = _page_cache_path(cache_dir, sha, page)
+    return p.read_text(encoding="utf-8") if p.exists() else None
+
+
+# ------------------------------
+# Batch extraction
+# ------------------------------
+def page_records(source: str, pdf_path: Path, sha: str, pages: List[str]) -> Iterator[Dict]:
+    """
+    One record per page. char_start/char_end index into the file's raw_text as the
+    single-file extractors build it (pages joined by PAGE_SEP, then stripped), and
+    text is exactly raw_text[char_start:char_end] (edge whitespace of the file trimmed).
+    """
+    raw = PAGE_SEP.join(pages)
+    raw_text = raw.strip()
+    lead = len(raw) - len(raw.lstrip())
+    total = len(raw_text)
+    offset = 0
+    for i, page in enumerate(pages):
+        start = min(total, max(0, offset - lead))
+        end = min(total, max(0, offset + len(page) - lead))
+        yield {
+            "source": source,
+            "path": str(pdf_path),
+            "sha256": sha,
+            "page": i,
+            "num_pages": len(pages),
+            "char_start": start,
+            "char_end": end,
+            "text": raw_text[start:end],
+        }
+        offset += len(page) + len(PAGE_SEP)
+
+
+def _plan_file(pool_factory, path: Path, cache_dir: Path) -> Tuple:
+    """
+    Hash one PDF and schedule whatever isn't cached. Returns
+    (path, sha, cached_pages, parts, error): cached_pages is set on a full cache hit;
+    otherwise parts holds, per PAGES_PER_TASK range, cached page texts or a Future.
+    """
+    try:
+        sha = file_sha256(path)
+        cached = load_cached_pages(cache_dir, sha)
+        if cached is not None:
+            return path, sha, cached, [], None
+
+        num_pages = len(PdfReader(str(path)).pages)
+        parts = []
+        for start in range(0, num_pages, PAGES_PER_TASK):
+            stop = min(num_pages, start + PAGES_PER_TASK)
+            # A crashed earlier run may have cached part of this file already.
+            hits = [_cached_page(cache_dir, sha, i) for i in range(start, stop)]
+            if all(h is not None for h in hits):
+                parts.append(hits)
+            else:
+                parts.append(pool_factory().submit(_extract_page_range, str(path), start, stop))
+        return path, sha, None, parts, None
+    except Exception as e:  # unreadable / truncated PDF: skip it, keep the batch going
+        return path, "", None, [], e
+
+
+def extract_pdfs(
+    pdf_paths: Iterable[Path],
+    workers: Optional[int] = None,
+    cache_dir: Path = CACHE_DIR,
+) -> Iterator[Tuple[Path, str, Optional[List[str]], str]]:
+    """
+    Yield (path, sha256, page_texts, status) per PDF, in input order, where status is
+    "cached", "extracted" or "failed" (page_texts is None). Unchanged files are served
+    from the page cache; uncached page ranges go to a process pool, which is only
+    started if something needs extracting. At most 2x workers files are in flight, so
+    memory stays flat and results stream as soon as the oldest file is done.
+    """
+    window = 2 * (workers or os.cpu_count() or 1)
+    pool: Optional[ProcessPoolExecutor] = None
+
+    def pool_factory() -> ProcessPoolExecutor:
+        nonlocal pool
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        return pool
+
+    def uses_pool(entry: Tuple) -> bool:
+        _, _, _, parts, error = entry
+        return isinstance(error, BrokenProcessPool) or any(isinstance(p, Future) for p in parts)
+
+    paths = iter(pdf_paths)
+    pending: Deque[Tuple] = deque()
+    attempts: Dict[Path, int] = {}  # pool breakages each file was in flight for
+    try:
+        for path in islice(paths, window):
+            pending.append(_plan_file(pool_factory, path, cache_dir))
+        while pending:
+            entry = pending.popleft()
+            path, sha, cached, parts, error = entry
+            nxt = next(paths, None)
+            if nxt is not None:
+                pending.append(_plan_file(pool_factory, nxt, cache_dir))
+
+            if cached is not None:
+                yield path, sha, cached, "cached"
+                continue
+
+            pages: List[str] = []
+            fresh: List[int] = []  # only newly extracted pages are written to the cache
+            if error is None:
+                try:
+                    for part in parts:
+                        if isinstance(part, list):
+                            pages.extend(part)
+                        else:
+                            got = part.result()
+                            fresh.extend(range(len(pages), len(pages) + len(got)))
+                            pages.extend(got)
+                except Exception as e:
+                    error = e
+
+            if isinstance(error, BrokenProcessPool):
+                # A worker died (e.g. OOM-killed on a huge PDF) and took every future of the
+                # pool with it. Start a fresh pool and re-plan the files that were in flight;
+                # a file caught in MAX_POOL_ATTEMPTS breakages is given up on.
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = None
+                replanned: Deque[Tuple] = deque()
+                for e in [entry] + list(pending):
+                    if uses_pool(e):
+                        attempts[e[0]] = attempts.get(e[0], 0) + 1
+                        if attempts[e[0]] < MAX_POOL_ATTEMPTS:
+                            e = _plan_file(pool_factory, e[0], cache_dir)
+                        else:
+                            e = (e[0], e[1], None, [], error)
+                    replanned.append(e)
+                pending = replanned
+                continue
+
+            if error is not None:
+                for part in parts:
+                    if isinstance(part, Future):
+                        part.cancel()
+                print(f"⚠️ Skipping {path}: {type(error).__name__}: {error}")
+                yield path, sha, None, "failed"
+                continue
+
+            for i in fresh:
+                _write_atomic(_page_cache_path(cache_dir, sha, i), pages[i])
+            # meta.json last: its presence marks the file as fully cached.
+            _write_atomic(cache_dir / sha / "meta.json", json.dumps({"num_pages": len(pages), "path": str(path)}))
+            yield path, sha, pages, "extracted"
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def extract_pdf_dir(
+    source: str,
+    pdf_dir: str,
+    output_path: str,
+    workers: Optional[int] = None,
+    cache_dir: Path = CACHE_DIR,
+) -> Tuple[int, int, int]:
+    """
+    Stream page-level JSONL for every *.pdf (any case) under pdf_dir. Returns (files, cache_hits, failed),
+    where files counts PDFs written. Output goes to a temp file renamed into place at the
+    end, so an interrupted run never leaves a truncated JSONL behind.
+    """
+    # Suffix matched case-insensitively: LinkedIn and scanner exports are often *.PDF.
+    pdf_paths = sorted(p for p in Path(pdf_dir).rglob("*") if p.suffix.lower() == ".pdf" and p.is_file())
+    out_path = Path(output_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+
+    files = hits = failed = 0
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for path, sha, pages, status in extract_pdfs(pdf_paths, workers=workers, cache_dir=cache_dir):
+                if status == "failed":
+                    failed += 1
+                    continue
+                for rec in page_records(source, path, sha, pages):
+                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                files += 1
+                hits += int(status == "cached")
+        os.replace(tmp_path, out_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return files, hits, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-extract resume / LinkedIn PDFs to page-level JSONL.")
+    parser.add_argument("--source", required=True, choices=["resume", "linkedin"])
+    parser.add_argument("pdf_dir", help="Directory scanned recursively for *.pdf")
+    parser.add_argument("output", nargs="?", help="Defaults to processed/<source>_pages.jsonl")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    parser.add_argument("--cache-dir", default=str(CACHE_DIR))
+    args = parser.parse_args()
+
+    output = args.output or str(Path("processed") / f"{args.source}_pages.jsonl")
+    files, hits, failed = extract_pdf_dir(
+        args.source, args.pdf_dir, output, workers=args.workers, cache_dir=Path(args.cache_dir)
+    )
+    print(f"✅ Wrote {output} ({files} PDFs, {hits} unchanged from cache, {failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
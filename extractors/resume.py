@@ -10,5 +10,6 @@ def extract_resume(pdf_path: str, output_path: str):
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
+# Many PDFs at once (parallel, cached, page-level JSONL): extractors/pdf_batch.py --source resume <dir>
 if __name__ == "__main__":
     extract_resume("data/resume.pdf", "processed/resume.json")
\ No newline at end of file
@@ -1,23 +1,47 @@
 from __future__ import annotations
+import argparse
+import multiprocessing as mp
 import os
+import random
+import time
 import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List
+from itertools import islice
+from typing import TYPE_CHECKING, Deque, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 from dotenv import load_dotenv
 from pymongo import MongoClient
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams, PointStruct
-from sentence_transformers import SentenceTransformer
+from qdrant_client.http.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Distance,
+    PointStruct,
+    VectorParams,
+)
 from tqdm import tqdm
 
+if TYPE_CHECKING:  # imported lazily in load_model: the parent of a worker pool never needs it
+    from sentence_transformers import SentenceTransformer
+
 
 # ------------------------------
 # Config
 # ------------------------------
 CHUNK_SIZE = 800
 CHUNK_OVERLAP = 100
-EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"  # 384-dim
+EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBED_DIM = 384  # EMBED_MODEL's output size; sizes the collection without loading the model
+UPSERT_BATCH = 256
+SHARD_DOCS = 32  # docs per work item handed to an embedding worker
+VERSION_SEP = "__"  # <alias>__<YYYYmmdd-HHMMSS>-<suffix> names a versioned collection
+SAMPLE_QUERIES = 50  # points re-queried to check recall before the alias switch
+RECALL_TOP_K = 10
 
 
 @dataclass
@@ -51,7 +75,11 @@ def chunk_text(text: str, size: int, overlap: int) -> List[str]:
 
 def iter_docs(mongo_uri: str, db: str, coll: str) -> Iterable[Doc]:
     client = MongoClient(mongo_uri)
-    for row in client[db][coll].find({"text": {"$ne": ""}}, projection={"text": 1, "source": 1, "metadata": 1}):
+    # Sorted by _id so shards (and therefore upload order) are stable across runs.
+    cursor = client[db][coll].find(
+        {"text": {"$ne": ""}}, projection={"text": 1, "source": 1, "metadata": 1}
+    ).sort("_id", 1)
+    for row in cursor:
         yield Doc(
             _id=str(row.get("_id")),
             source=str(row.get("source", "")),
@@ -61,67 +89,468 @@ def iter_docs(mongo_uri: str, db: str, coll: str) -> Iterable[Doc]:
     client.close()
 
 
+def point_id(doc_id: str, chunk_index: int) -> str:
+    """Deterministic point id, so rebuilds (single- or multi-process) yield identical ids."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"postcraft:{doc_id}:{chunk_index}"))
+
+
+def embed_doc(model: SentenceTransformer, d: Doc) -> List[PointStruct]:
+    chunks = chunk_text(d.text, CHUNK_SIZE, CHUNK_OVERLAP)
+    if not chunks:
+        return []
+
+    # Encode per doc (not per shard) so batch padding matches the single-process path.
+    embeds = model.encode(chunks, show_progress_bar=False, normalize_embeddings=True)
+
+    points: List[PointStruct] = []
+    for idx, (chunk, vec) in enumerate(zip(chunks, embeds)):
+        payload = {
+            "doc_id": d._id,
+            "chunk_index": idx,
+            "source": d.source,
+            "metadata": d.metadata,
+            "text": chunk,
+        }
+        points.append(PointStruct(id=point_id(d._id, idx), vector=vec.tolist(), payload=payload))
+    return points
+
+
+# ------------------------------
+# Multi-process embedding
+# ------------------------------
+POOL_DEVICE = "cpu"  # worker pools always embed on CPU; in-process runs auto-detect by default
+_worker_model: Optional[SentenceTransformer] = None
+
+
+def load_model(threads: Optional[int] = None, device: Optional[str] = None) -> SentenceTransformer:
+    """Load EMBED_MODEL on `device` (None = auto-detect), pinning torch intra-op threads if given."""
+    from sentence_transformers import SentenceTransformer
+
+    if threads:
+        import torch
+
+        torch.set_num_threads(threads)
+    return SentenceTransformer(EMBED_MODEL, device=device)
+
+
+def _init_worker(threads: int) -> None:
+    """Load the model once per worker process."""
+    global _worker_model
+    _worker_model = load_model(threads, POOL_DEVICE)
+
+
+def _embed_shard(shard: List[Doc]) -> List[PointStruct]:
+    points: List[PointStruct] = []
+    for d in shard:
+        points.extend(embed_doc(_worker_model, d))
+    return points
+
+
+def shard_docs(docs: List[Doc], size: int) -> List[List[Doc]]:
+    return [docs[i:i + size] for i in range(0, len(docs), size)]
+
+
+def default_threads(workers: int) -> int:
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def embed_points(
+    docs: List[Doc],
+    workers: int,
+    threads: Optional[int] = None,
+    model: Optional[SentenceTransformer] = None,
+    device: Optional[str] = None,
+) -> Iterator[PointStruct]:
+    """
+    Yield points for all docs, in _id order.
+    workers <= 1 embeds in-process on `device` (None = auto-detect), with torch's default
+    thread count unless `threads` is given. Otherwise contiguous _id shards are fanned out
+    to a CPU process pool, each worker pinned to `threads` (default: cores / workers), and
+    streamed back in submission order.
+    """
+    if workers <= 1:
+        model = model or load_model(threads, device)
+        for d in tqdm(docs, desc="Chunk + embed"):
+            yield from embed_doc(model, d)
+        return
+
+    shards = iter(shard_docs(docs, SHARD_DOCS))
+    window = 2 * workers  # shards in flight; bounds memory if upload is slower than embedding
+    # spawn: forking a process that already holds torch thread pools can deadlock.
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(threads or default_threads(workers),),
+    )
+    pending: Deque[Future] = deque()
+    progress = tqdm(total=-(-len(docs) // SHARD_DOCS), desc=f"Chunk + embed ({workers} workers)")
+    try:
+        for shard in islice(shards, window):
+            pending.append(pool.submit(_embed_shard, shard))
+        while pending:
+            points = pending.popleft().result()
+            nxt = next(shards, None)
+            if nxt is not None:
+                pending.append(pool.submit(_embed_shard, nxt))
+            progress.update(1)
+            yield from points
+    finally:
+        # If the consumer failed (e.g. an upsert error), drop queued shards instead of
+        # embedding the rest of the corpus before the caller's cleanup can run.
+        progress.close()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def verify_determinism(docs: List[Doc], workers: int, threads: Optional[int] = None, shards: int = 4) -> bool:
+    """
+    Embed the first few shards with a default single-process run (unpinned threads) and
+    with the pool; ids and vectors must match exactly. Both sides run on POOL_DEVICE.
+    """
+    workers = max(2, workers)
+    sample = docs[:shards * SHARD_DOCS]
+    single = list(embed_points(sample, 1, device=POOL_DEVICE))
+    multi = list(embed_points(sample, workers, threads))
+
+    if [p.id for p in single] != [p.id for p in multi]:
+        print(f"❌ Point ids differ between single-process and {workers}-worker runs")
+        return False
+    mismatched = sum(
+        not np.array_equal(np.asarray(a.vector), np.asarray(b.vector)) for a, b in zip(single, multi)
+    )
+    if mismatched:
+        print(f"❌ {mismatched}/{len(single)} vectors differ between single-process and {workers}-worker runs")
+        return False
+    print(f"✅ {len(single)} points identical: single-process (default threads) vs {workers} workers "
+          f"({threads or default_threads(workers)} thread(s) each), device={POOL_DEVICE}")
+    return True
+
+
+def report_scaling(
+    docs: List[Doc],
+    max_workers: int,
+    threads: Optional[int] = None,
+    device: Optional[str] = None,
+    sample_docs: int = 1000,
+) -> None:
+    """
+    Embed the first `sample_docs` docs (no upload) with a default single-process run, then
+    with 2, 4, ... max_workers pooled workers, and print speedup against the default run.
+    Each pooled row uses the threads a real run with that --workers would (unless pinned).
+    """
+    sample = docs[:sample_docs]
+    counts = []
+    w = 2
+    while w < max_workers:
+        counts.append(w)
+        w *= 2
+    if max_workers > 1:
+        counts.append(max_workers)
+
+    print(f"\n📈 Scaling report ({len(sample)} of {len(docs)} docs)")
+    print(f"{'run':>16} {'chunks':>8} {'seconds':>9} {'chunks/s':>10} {'speedup':>8}")
+    baseline = None
+    rows = [("single-process", 1, threads, device)] + [
+        (f"{w} x {threads or default_threads(w)} thr", w, threads, None) for w in counts
+    ]
+    for label, w, thr, dev in rows:
+        t0 = time.perf_counter()
+        n = sum(1 for _ in embed_points(sample, w, thr, device=dev))
+        dt = time.perf_counter() - t0
+        baseline = baseline or dt
+        print(f"{label:>16} {n:>8} {dt:>9.2f} {n / dt if dt else 0:>10.1f} {baseline / dt if dt else 0:>7.2f}x")
+
+
+# ------------------------------
+# Versioned collections (blue/green)
+# ------------------------------
+def versioned_name(alias: str) -> str:
+    # Random suffix so two rebuilds started in the same second don't collide.
+    return f"{alias}{VERSION_SEP}{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def list_versions(qdrant: QdrantClient, alias: str) -> List[str]:
+    """Versioned collections behind `alias`, oldest first (timestamps sort lexically)."""
+    prefix = alias + VERSION_SEP
+    return sorted(c.name for c in qdrant.get_collections().collections if c.name.startswith(prefix))
+
+
+def alias_target(qdrant: QdrantClient, alias: str) -> Optional[str]:
+    for a in qdrant.get_aliases().aliases:
+        if a.alias_name == alias:
+            return a.collection_name
+    return None
+
+
+def is_legacy_collection(qdrant: QdrantClient, alias: str) -> bool:
+    """True if a plain (pre-alias) collection owns the alias name."""
+    return alias in {c.name for c in qdrant.get_collections().collections}
+
+
+# A version only counts for rollback/pruning once it has passed validation. Completed
+# versions are recorded as points in a tiny side collection (one 1-dim dummy vector each),
+# so a run killed before validation leaves an unregistered collection that gets GC'd.
+def registry_name(alias: str) -> str:
+    return f"{alias}_versions"
+
+
+def _ensure_registry(qdrant: QdrantClient, alias: str) -> None:
+    if registry_name(alias) not in {c.name for c in qdrant.get_collections().collections}:
+        qdrant.create_collection(
+            collection_name=registry_name(alias),
+            vectors_config=VectorParams(size=1, distance=Distance.DOT),
+        )
+
+
+def _registry_id(collection: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"postcraft-version:{collection}"))
+
+
+def mark_validated(qdrant: QdrantClient, alias: str, collection: str, points: int, recall: float) -> None:
+    _ensure_registry(qdrant, alias)
+    payload = {
+        "collection": collection,
+        "points": points,
+        "recall": recall,
+        "model": EMBED_MODEL,
+        "validated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    qdrant.upsert(
+        collection_name=registry_name(alias),
+        points=[PointStruct(id=_registry_id(collection), vector=[1.0], payload=payload)],
+    )
+
+
+def validated_versions(qdrant: QdrantClient, alias: str) -> List[str]:
+    """Existing versions of `alias` that passed validation, oldest first."""
+    if registry_name(alias) not in {c.name for c in qdrant.get_collections().collections}:
+        return []
+    names, offset = set(), None
+    while True:
+        rows, offset = qdrant.scroll(registry_name(alias), limit=256, offset=offset, with_payload=True)
+        names.update((r.payload or {}).get("collection") for r in rows)
+        if offset is None:
+            break
+    return [v for v in list_versions(qdrant, alias) if v in names]
+
+
+def unmark_validated(qdrant: QdrantClient, alias: str, collection: str) -> None:
+    if registry_name(alias) in {c.name for c in qdrant.get_collections().collections}:
+        qdrant.delete(collection_name=registry_name(alias), points_selector=[_registry_id(collection)])
+
+
+def drop_version(qdrant: QdrantClient, alias: str, collection: str) -> None:
+    qdrant.delete_collection(collection)
+    unmark_validated(qdrant, alias, collection)
+
+
+def switch_alias(qdrant: QdrantClient, alias: str, target: str, migrate_legacy: bool = False) -> None:
+    """Atomically repoint `alias` at `target` (delete + create in one request)."""
+    ops = []
+    if alias_target(qdrant, alias) is not None:
+        ops.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+    elif is_legacy_collection(qdrant, alias):
+        if not migrate_legacy:
+            raise ValueError(
+                f"'{alias}' is a plain collection, not an alias. Re-run with --migrate-legacy to "
+                f"replace it (it is deleted, readers see a brief gap, and it cannot be rolled back to)."
+            )
+        print(f"⚠️ Migrating: dropping legacy collection '{alias}' so it can become an alias")
+        qdrant.delete_collection(alias)
+    ops.append(CreateAliasOperation(create_alias=CreateAlias(collection_name=target, alias_name=alias)))
+    qdrant.update_collection_aliases(change_aliases_operations=ops)
+
+
+def prune_versions(
+    qdrant: QdrantClient, alias: str, live: str, keep: int, previous: Optional[str] = None
+) -> List[str]:
+    """
+    Keep `keep` versions older than `live` for rollback and drop the rest. `previous` (the
+    version live before `live`) is always one of them; the others are the most recent
+    validated ones. Unvalidated versions older than `live` are leftovers of killed runs or
+    versions rolled back away from, and are dropped too; newer unvalidated ones may be a
+    rebuild still in progress, so they stay.
+    """
+    validated = set(validated_versions(qdrant, alias))
+    older = [v for v in list_versions(qdrant, alias) if v < live and v != previous]
+    good = [v for v in older if v in validated]
+    room = max(0, keep - (1 if previous else 0))
+    stale = [v for v in older if v not in validated] + (good[:-room] if room > 0 else good)
+    for name in stale:
+        drop_version(qdrant, alias, name)
+    return sorted(stale)
+
+
+def promote(
+    qdrant: QdrantClient, alias: str, collection: str, keep: int, migrate_legacy: bool = False
+) -> List[str]:
+    """Switch `alias` to a validated `collection` and prune; returns the dropped versions."""
+    previous = alias_target(qdrant, alias)
+    switch_alias(qdrant, alias, collection, migrate_legacy=migrate_legacy)
+    return prune_versions(qdrant, alias, collection, keep, previous=previous)
+
+
+def rollback(qdrant: QdrantClient, alias: str) -> str:
+    """
+    Repoint `alias` at the newest validated version older than the live one. The version
+    left behind is deregistered, so later rollbacks and prunes treat it as rejected.
+    """
+    current = alias_target(qdrant, alias)
+    older = [v for v in validated_versions(qdrant, alias) if current is None or v < current]
+    if not older:
+        raise ValueError(f"No previous validated version of '{alias}' to roll back to.")
+    switch_alias(qdrant, alias, older[-1])
+    if current is not None:
+        unmark_validated(qdrant, alias, current)
+    return older[-1]
+
+
+def validate_collection(
+    qdrant: QdrantClient,
+    collection: str,
+    expected_points: int,
+    samples: List[Tuple[str, List[float]]],
+    min_recall: float,
+) -> float:
+    """
+    Gate before the alias switch: exact point count must match what was upserted, and
+    each sampled point, queried by its own vector, must come back in the top-k.
+    """
+    count = qdrant.count(collection, exact=True).count
+    if count != expected_points:
+        raise ValueError(f"Point count mismatch in '{collection}': {count} != {expected_points}")
+
+    if not samples:
+        return 1.0
+    hits = 0
+    for pid, vec in samples:
+        res = qdrant.search(collection_name=collection, query_vector=vec, limit=RECALL_TOP_K)
+        if any(str(h.id) == pid for h in res):
+            hits += 1
+    recall = hits / len(samples)
+    if recall < min_recall:
+        raise ValueError(f"Sample recall@{RECALL_TOP_K} in '{collection}' is {recall:.2f} < {min_recall:.2f}")
+    return recall
+
+
 # ------------------------------
 # Main
 # ------------------------------
 def main():
     load_dotenv()
 
+    parser = argparse.ArgumentParser(description="Chunk + embed Mongo docs into Qdrant.")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("EMBED_WORKERS", "1")),
+                        help="Embedding processes (1 = in-process)")
+    parser.add_argument("--threads-per-worker", type=int, default=os.getenv("EMBED_THREADS_PER_WORKER"),
+                        help="Pin torch intra-op threads (default: torch's own in-process, cores / workers in a pool)")
+    parser.add_argument("--device", default=os.getenv("EMBED_DEVICE"),
+                        help="Torch device for --workers 1 (default: auto-detect); worker pools always use cpu")
+    parser.add_argument("--scaling-report", action="store_true",
+                        help="Only time embedding single-process vs 2..--workers processes on a sample; no upload")
+    parser.add_argument("--scaling-docs", type=int, default=int(os.getenv("EMBED_SCALING_DOCS", "1000")),
+                        help="Docs embedded per row of --scaling-report")
+    parser.add_argument("--verify", action="store_true",
+                        help="Check a few shards embed identically single-process and in workers (on cpu); no upload")
+    parser.add_argument("--keep-versions", type=int, default=int(os.getenv("QDRANT_KEEP_VERSIONS", "2")),
+                        help="Previous collection versions to keep for rollback")
+    parser.add_argument("--min-recall", type=float, default=float(os.getenv("QDRANT_MIN_RECALL", "0.95")),
+                        help="Sample-query recall required before switching the alias")
+    parser.add_argument("--rollback", action="store_true",
+                        help="Point the alias back at the previous validated version and exit")
+    parser.add_argument("--migrate-legacy", action="store_true",
+                        help="One-time: replace a plain collection named like the alias once the new version validates")
+    args = parser.parse_args()
+    threads = int(args.threads_per_worker) if args.threads_per_worker else None
+    if args.workers > 1 and args.device not in (None, POOL_DEVICE):
+        raise SystemExit(f"❌ --device {args.device} only applies to --workers 1; worker pools run on {POOL_DEVICE}")
+
     # env
     mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
     mongo_db = os.getenv("MONGODB_DB", "postcraft")
     mongo_coll = os.getenv("MONGODB_COLLECTION", "raw_docs")
 
     qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
-    collection = os.getenv("QDRANT_COLLECTION", "postcraft_chunks")
+    alias = os.getenv("QDRANT_COLLECTION", "postcraft_chunks")  # readers query this alias
+
+    if args.rollback:
+        qdrant = QdrantClient(url=qdrant_url, prefer_grpc=False)
+        target = rollback(qdrant, alias)
+        print(f"↩️ Alias '{alias}' now points to '{target}'")
+        return
+
+    print(f"📥 Pulling docs from Mongo: {mongo_db}.{mongo_coll}")
+    docs = list(iter_docs(mongo_uri, mongo_db, mongo_coll))
+    print(f"Found {len(docs)} docs with non-empty text")
+
+    if args.scaling_report:
+        report_scaling(docs, max(1, args.workers), threads, args.device, args.scaling_docs)
+        return
+    if args.verify:
+        if not verify_determinism(docs, args.workers, threads):
+            raise SystemExit(1)
+        return
 
     # clients
     qdrant = QdrantClient(url=qdrant_url, prefer_grpc=False)
-    model = SentenceTransformer(EMBED_MODEL)
+    if is_legacy_collection(qdrant, alias) and not args.migrate_legacy:
+        raise SystemExit(
+            f"❌ '{alias}' is a plain collection, not an alias. Re-run with --migrate-legacy to replace it "
+            f"with the new version once it validates (the old collection is deleted and cannot be rolled back to)."
+        )
+    # Only an in-process run needs a model here; pool workers load their own.
+    model = load_model(threads, args.device) if args.workers <= 1 else None
+    dim = model.get_sentence_embedding_dimension() if model else EMBED_DIM
 
-    # recreate collection (overwrite behavior)
-    qdrant.recreate_collection(
+    # Build into a fresh versioned collection; the live alias keeps serving the old one.
+    collection = versioned_name(alias)
+    qdrant.create_collection(
         collection_name=collection,
-        vectors_config=VectorParams(size=model.get_sentence_embedding_dimension(), distance=Distance.COSINE),
+        vectors_config=VectorParams(size=dim, distance=Distance.COSINE),
     )
+    print(f"🧱 Building '{collection}' (live: '{alias_target(qdrant, alias) or '-'}')")
 
-    print(f"📥 Pulling docs from Mongo: {mongo_db}.{mongo_coll}")
-    docs = list(iter_docs(mongo_uri, mongo_db, mongo_coll))
-    print(f"Found {len(docs)} docs with non-empty text")
-
+    # Single upload stage: points stream in from the embedder(s) and are upserted in batches.
     total_chunks = 0
     batch_points: List[PointStruct] = []
-    BATCH = 256
-
-    for d in tqdm(docs, desc="Chunk + embed"):
-        chunks = chunk_text(d.text, CHUNK_SIZE, CHUNK_OVERLAP)
-        if not chunks:
-            continue
-
-        embeds = model.encode(chunks, show_progress_bar=False, normalize_embeddings=True)
-
-        for idx, (chunk, vec) in enumerate(zip(chunks, embeds)):
-            pid = str(uuid.uuid4())
-            payload = {
-                "doc_id": d._id,
-                "chunk_index": idx,
-                "source": d.source,
-                "metadata": d.metadata,
-                "text": chunk,
-            }
-            batch_points.append(PointStruct(id=pid, vector=vec.tolist(), payload=payload))
-            total_chunks += 1
+    samples: List[Tuple[str, List[float]]] = []  # reservoir of points for the recall check
+    rng = random.Random(0)
+    t0 = time.perf_counter()
 
-            if len(batch_points) >= BATCH:
+    try:
+        for point in embed_points(docs, args.workers, threads, model=model):
+            batch_points.append(point)
+            total_chunks += 1
+            if len(samples) < SAMPLE_QUERIES:
+                samples.append((point.id, point.vector))
+            else:
+                j = rng.randrange(total_chunks)
+                if j < SAMPLE_QUERIES:
+                    samples[j] = (point.id, point.vector)
+            if len(batch_points) >= UPSERT_BATCH:
                 qdrant.upsert(collection_name=collection, points=batch_points)
                 batch_points.clear()
 
-    if batch_points:
-        qdrant.upsert(collection_name=collection, points=batch_points)
-        batch_points.clear()
+        if batch_points:
+            qdrant.upsert(collection_name=collection, points=batch_points)
+            batch_points.clear()
+
+        dt = time.perf_counter() - t0
+        print(f"Indexed {total_chunks} chunks into '{collection}' "
+              f"in {dt:.1f}s ({total_chunks / dt if dt else 0:.1f} chunks/s, workers={args.workers})")
+
+        recall = validate_collection(qdrant, collection, total_chunks, samples, args.min_recall)
+        mark_validated(qdrant, alias, collection, total_chunks, recall)
+    except BaseException:
+        # Never leave a half-built version around; the alias was not touched.
+        print(f"❌ Rebuild failed, dropping '{collection}'; '{alias}' unchanged")
+        drop_version(qdrant, alias, collection)
+        raise
 
-    print(f"✅ Indexed {total_chunks} chunks into Qdrant collection '{collection}'")
+    pruned = promote(qdrant, alias, collection, args.keep_versions, migrate_legacy=args.migrate_legacy)
+    print(f"✅ Alias '{alias}' -> '{collection}' (recall@{RECALL_TOP_K}={recall:.2f}, "
+          f"pruned {len(pruned)} old version(s))")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
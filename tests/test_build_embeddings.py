@@ -0,0 +1,143 @@
+import sys
+import textwrap
+import types
+import uuid
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pymongo")
+pytest.importorskip("qdrant_client")
+pytest.importorskip("tqdm")
+pytest.importorskip("dotenv")
+
+from features import build_embeddings as be
+from features.build_embeddings import Doc, embed_points, point_id
+
+# Deterministic stand-in for SentenceTransformer: vectors derive from a hash of the text,
+# so the in-process and spawned-worker paths must agree exactly.
+STUB_SENTENCE_TRANSFORMERS = textwrap.dedent('''
+    import hashlib
+    import numpy as np
+
+    class SentenceTransformer:
+        def __init__(self, name, device=None):
+            self.device = device
+
+        def get_sentence_embedding_dimension(self):
+            return 8
+
+        def encode(self, chunks, **kwargs):
+            return np.array(
+                [np.frombuffer(hashlib.sha256(c.encode()).digest()[:8], dtype=np.uint8) / 255.0 for c in chunks],
+                dtype=np.float32,
+            )
+''')
+STUB_TORCH = "def set_num_threads(n):\n    pass\n"
+
+
+@pytest.fixture
+def stub_model(tmp_path, monkeypatch):
+    """Put stub sentence_transformers/torch first on sys.path (spawned workers inherit it)."""
+    stubs = tmp_path / "stubs"
+    stubs.mkdir()
+    (stubs / "sentence_transformers.py").write_text(STUB_SENTENCE_TRANSFORMERS)
+    (stubs / "torch.py").write_text(STUB_TORCH)
+    monkeypatch.syspath_prepend(str(stubs))
+    for name in ("sentence_transformers", "torch"):
+        mod = types.ModuleType(name)
+        exec((stubs / f"{name}.py").read_text(), mod.__dict__)
+        monkeypatch.setitem(sys.modules, name, mod)
+
+
+def make_docs(n):
+    return [Doc(_id=f"{i:04d}", source="news", text=("word%d " % i) * (150 + i * 7), metadata={}) for i in range(n)]
+
+
+def test_point_id_is_stable():
+    assert point_id("abc", 0) == point_id("abc", 0)
+    assert point_id("abc", 0) != point_id("abc", 1)
+    assert point_id("abc", 0) != point_id("abd", 0)
+    assert uuid.UUID(point_id("abc", 3)).version == 5
+
+
+def test_pool_matches_single_process(stub_model, monkeypatch):
+    monkeypatch.setattr(be, "SHARD_DOCS", 3)  # several shards, so ordering across the pool matters
+    docs = make_docs(10)
+
+    single = list(embed_points(docs, 1))
+    multi = list(embed_points(docs, 2, threads=1))
+
+    assert len(single) > len(docs)  # multi-chunk docs
+    assert [p.id for p in single] == [point_id(p.payload["doc_id"], p.payload["chunk_index"]) for p in single]
+    assert [p.id for p in multi] == [p.id for p in single]
+    assert [p.payload for p in multi] == [p.payload for p in single]
+    assert [p.vector for p in multi] == [p.vector for p in single]
+    assert [p.payload["doc_id"] for p in single] == sorted(p.payload["doc_id"] for p in single)
+
+
+# ------------------------------
+# Versioned collections
+# ------------------------------
+ALIAS = "pc"
+
+
+@pytest.fixture
+def qdrant():
+    from qdrant_client import QdrantClient
+
+    return QdrantClient(":memory:")
+
+
+def build_version(qdrant, day, keep=2, validated=True):
+    """Create a version as a rebuild would; validated ones are promoted behind the alias."""
+    from qdrant_client.http.models import Distance, VectorParams
+
+    name = f"{ALIAS}{be.VERSION_SEP}2025010{day}-000000-aaaaaa"
+    qdrant.create_collection(name, vectors_config=VectorParams(size=1, distance=Distance.DOT))
+    if validated:
+        be.mark_validated(qdrant, ALIAS, name, points=0, recall=1.0)
+        be.promote(qdrant, ALIAS, name, keep)
+    return name
+
+
+def test_rebuild_rollback_rebuild_keeps_previous_live(qdrant):
+    v1, v2, v3, v4 = (build_version(qdrant, d) for d in range(1, 5))
+    assert be.list_versions(qdrant, ALIAS) == [v2, v3, v4]  # live + 2 kept
+
+    assert be.rollback(qdrant, ALIAS) == v3
+    assert be.rollback(qdrant, ALIAS) == v2
+    assert be.validated_versions(qdrant, ALIAS) == [v2]  # rolled-back-from versions deregistered
+
+    v5 = build_version(qdrant, 5)
+    assert be.alias_target(qdrant, ALIAS) == v5
+    assert be.list_versions(qdrant, ALIAS) == [v2, v5]  # v2 (live before v5) survives, v3/v4 pruned
+    assert be.rollback(qdrant, ALIAS) == v2
+
+
+def test_prune_drops_killed_runs_but_not_newer_ones(qdrant):
+    v1 = build_version(qdrant, 1)
+    crashed = build_version(qdrant, 2, validated=False)
+    v3 = build_version(qdrant, 3)
+    in_progress = build_version(qdrant, 5, validated=False)
+    v4 = build_version(qdrant, 4)
+
+    assert be.list_versions(qdrant, ALIAS) == [v1, v3, v4, in_progress]
+    assert crashed not in be.list_versions(qdrant, ALIAS)
+    assert be.rollback(qdrant, ALIAS) == v3
+
+
+def test_legacy_collection_is_refused_without_migrate(qdrant):
+    from qdrant_client.http.models import Distance, VectorParams
+
+    qdrant.create_collection(ALIAS, vectors_config=VectorParams(size=1, distance=Distance.DOT))
+    assert be.is_legacy_collection(qdrant, ALIAS)
+    with pytest.raises(ValueError, match="--migrate-legacy"):
+        build_version(qdrant, 1)
+    assert be.is_legacy_collection(qdrant, ALIAS)  # untouched
+    assert be.alias_target(qdrant, ALIAS) is None
+
+    v1 = f"{ALIAS}{be.VERSION_SEP}20250101-000000-aaaaaa"
+    be.promote(qdrant, ALIAS, v1, keep=2, migrate_legacy=True)
+    assert not be.is_legacy_collection(qdrant, ALIAS)
+    assert be.alias_target(qdrant, ALIAS) == v1
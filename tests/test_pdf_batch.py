@@ -0,0 +1,134 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyPDF2")
+canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+
+from extractors.pdf_batch import PAGES_PER_TASK, extract_pdf_dir, _extract_page_range, _page_cache_path
+from extractors.resume import extract_resume
+
+
+def make_pdf(path: Path, pages):
+    """Write a PDF with one text line per page; None gives a blank page."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    c = canvas.Canvas(str(path))
+    for text in pages:
+        if text is not None:
+            c.drawString(72, 720, text)
+        c.showPage()
+    c.save()
+    return path
+
+
+def read_jsonl(path: Path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def cache_inodes(cache_dir: Path):
+    return {p.name: p.stat().st_ino for p in cache_dir.rglob("page_*.txt")}
+
+
+@pytest.fixture
+def pdf_dir(tmp_path):
+    d = tmp_path / "pdfs"
+    make_pdf(d / "alice.pdf", [None, "Alice page 1", None, "Alice page 3"])
+    make_pdf(d / "bob" / "bob.pdf", [f"Bob page {i}" for i in range(PAGES_PER_TASK * 2 + 3)])
+    return d
+
+
+def run(pdf_dir, tmp_path):
+    out = tmp_path / "out.jsonl"
+    counts = extract_pdf_dir("resume", str(pdf_dir), str(out), workers=2, cache_dir=tmp_path / "cache")
+    return counts, read_jsonl(out)
+
+
+def test_one_record_per_page(pdf_dir, tmp_path):
+    (files, hits, failed), recs = run(pdf_dir, tmp_path)
+    assert (files, hits, failed) == (2, 0, 0)
+    by_file = {}
+    for r in recs:
+        by_file.setdefault(Path(r["path"]).name, []).append(r["page"])
+    assert by_file == {"alice.pdf": [0, 1, 2, 3], "bob.pdf": list(range(PAGES_PER_TASK * 2 + 3))}
+
+
+def test_offsets_match_single_file_extractor(pdf_dir, tmp_path):
+    _, recs = run(pdf_dir, tmp_path)
+    for pdf in sorted(pdf_dir.rglob("*.pdf")):
+        out = tmp_path / f"{pdf.stem}.json"
+        extract_resume(str(pdf), str(out))
+        raw_text = json.loads(out.read_text(encoding="utf-8"))["raw_text"]
+        pages = [r for r in recs if r["path"] == str(pdf)]
+        assert pages
+        for r in pages:
+            assert raw_text[r["char_start"]:r["char_end"]] == r["text"]
+    blanks = [r for r in recs if Path(r["path"]).name == "alice.pdf" and r["page"] in (0, 2)]
+    assert all(r["text"] == "" for r in blanks)
+
+
+def test_second_run_is_served_from_cache(pdf_dir, tmp_path, monkeypatch):
+    _, first = run(pdf_dir, tmp_path)
+    before = cache_inodes(tmp_path / "cache")
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started for an all-cached batch")
+
+    monkeypatch.setattr("extractors.pdf_batch.ProcessPoolExecutor", no_pool)
+
+    (files, hits, failed), second = run(pdf_dir, tmp_path)
+    assert hits == files == 2 and failed == 0
+    assert second == first
+    assert cache_inodes(tmp_path / "cache") == before  # nothing re-extracted or rewritten
+
+
+def test_only_missing_range_is_reextracted(pdf_dir, tmp_path):
+    _, first = run(pdf_dir, tmp_path)
+    sha = next(r["sha256"] for r in first if Path(r["path"]).name == "bob.pdf")
+    cache_dir = tmp_path / "cache"
+    missing = _page_cache_path(cache_dir, sha, PAGES_PER_TASK + 1)
+    before = {p: p.stat().st_ino for p in (cache_dir / sha).glob("page_*.txt")}
+    missing.unlink()
+
+    (files, hits, failed), second = run(pdf_dir, tmp_path)
+    assert (files, hits, failed) == (2, 1, 0)
+    assert second == first
+
+    after = {p: p.stat().st_ino for p in (cache_dir / sha).glob("page_*.txt")}
+    rewritten = sorted(int(p.stem.split("_")[1]) for p in after if before.get(p) != after[p])
+    assert rewritten == list(range(PAGES_PER_TASK, PAGES_PER_TASK * 2))
+
+
+def test_unreadable_pdf_is_skipped(pdf_dir, tmp_path):
+    (pdf_dir / "bad.pdf").write_bytes(b"%PDF-1.4 not really a pdf")
+    (files, hits, failed), recs = run(pdf_dir, tmp_path)
+    assert (files, failed) == (2, 1)
+    assert {Path(r["path"]).name for r in recs} == {"alice.pdf", "bob.pdf"}
+    assert not (tmp_path / "out.jsonl.tmp").exists()
+
+
+def _die_once(pdf_path, start, stop):
+    """Stand-in for _extract_page_range whose first call kills the worker, like an OOM kill."""
+    marker = Path(os.environ["PDF_BATCH_DIED_MARKER"])
+    if not marker.exists():
+        marker.touch()
+        os._exit(1)
+    return _extract_page_range(pdf_path, start, stop)
+
+
+def test_worker_crash_restarts_pool(pdf_dir, tmp_path, monkeypatch):
+    monkeypatch.setenv("PDF_BATCH_DIED_MARKER", str(tmp_path / "died"))
+    monkeypatch.setattr("extractors.pdf_batch._extract_page_range", _die_once)
+
+    (files, hits, failed), recs = run(pdf_dir, tmp_path)
+    assert (tmp_path / "died").exists()
+    assert (files, hits, failed) == (2, 0, 0)
+    assert {Path(r["path"]).name for r in recs} == {"alice.pdf", "bob.pdf"}
+
+
+def test_uppercase_suffix_is_included(pdf_dir, tmp_path):
+    make_pdf(pdf_dir / "CAROL.PDF", ["Carol page 0"])
+    (files, _, failed), recs = run(pdf_dir, tmp_path)
+    assert (files, failed) == (3, 0)
+    assert "CAROL.PDF" in {Path(r["path"]).name for r in recs}